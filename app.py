@@ -9,7 +9,7 @@ from database import (
     get_user_by_username, get_tasks_by_user, get_all_tasks,
     create_task, update_task_status, add_comment
 )
-from utils import format_timedelta, send_email_notification, check_overdue_tasks, send_task_assignment_notification, send_task_completion_notification, send_task_update_notification
+from utils import format_timedelta, get_upcoming_deadlines, send_email_notification, check_overdue_tasks, send_task_assignment_notification, send_task_completion_notification, send_task_update_notification
 
 # Initialize session state
 if 'authenticated' not in st.session_state:
@@ -270,6 +270,23 @@ def main():
                 else:
                     tasks = get_tasks_by_user(Session, st.session_state.user.id)
                 
+                # Due soon panel
+                upcoming = get_upcoming_deadlines(
+                    Session,
+                    days=7,
+                    user_id=None if st.session_state.user.is_admin else st.session_state.user.id
+                )
+                with st.expander(f"Due Soon ({len(upcoming)})", expanded=bool(upcoming)):
+                    if not upcoming:
+                        st.write("No open tasks due in the next 7 days.")
+                    now = datetime.now()
+                    for task in upcoming:
+                        st.write(
+                            f"**{task.title}** - {task.user.username} - due "
+                            f"{task.deadline.strftime('%Y-%m-%d %H:%M')} "
+                            f"(in {format_timedelta(task.deadline - now)})"
+                        )
+                
                 # Create tabs for different views
                 tab1, tab2, tab3 = st.tabs(["Timeline", "Tasks", "Analytics"])
                 
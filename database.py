@@ -1,6 +1,6 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Enum, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, joinedload
 import enum
 from datetime import datetime
 
@@ -35,6 +35,9 @@ class Task(Base):
     user = relationship("User", back_populates="tasks")
     comments = relationship("Comment", back_populates="task")
 
+    # Deadline-ordered index backing the upcoming-deadline range queries
+    __table_args__ = (Index('ix_tasks_deadline', 'deadline'),)
+
 class Comment(Base):
     __tablename__ = 'comments'
     
@@ -50,6 +53,9 @@ class Comment(Base):
 def init_db():
     engine = create_engine('sqlite:///intern_tracker.db')
     Base.metadata.create_all(engine)
+    # create_all skips indexes on tables that already exist, so add them explicitly
+    for index in Task.__table__.indexes:
+        index.create(engine, checkfirst=True)
     return sessionmaker(bind=engine)()
 
 # Helper functions
@@ -62,6 +68,18 @@ def get_tasks_by_user(session, user_id):
 def get_all_tasks(session):
     return session.query(Task).all()
 
+def get_upcoming_tasks(session, start, end, user_id=None):
+    """Get open tasks with deadlines in [start, end], ordered by deadline."""
+    query = (
+        session.query(Task)
+        .options(joinedload(Task.user))
+        .filter(Task.deadline >= start, Task.deadline <= end)
+        .filter(Task.status != TaskStatus.COMPLETED)
+    )
+    if user_id is not None:
+        query = query.filter(Task.user_id == user_id)
+    return query.order_by(Task.deadline).all()
+
 def create_task(session, title, description, deadline, user_id):
     task = Task(
         title=title,
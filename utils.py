@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
 import sys
+from database import init_db, TaskStatus, get_upcoming_tasks
 
 # Load environment variables
 load_dotenv()
@@ -142,7 +143,8 @@ def send_task_completion_notification(task, user):
 
 def check_overdue_tasks(tasks):
     """Check for overdue tasks and send notifications."""
-    now = datetime.utcnow()
+    # Deadlines are stored as naive local times (see main()), so compare against local now
+    now = datetime.now()
     overdue_tasks = [task for task in tasks if task.deadline < now and task.status != TaskStatus.COMPLETED]
     
     for task in overdue_tasks:
@@ -162,11 +164,47 @@ def check_overdue_tasks(tasks):
         """
         send_email_notification(task.user.email, subject, body)
 
-def get_upcoming_deadlines(tasks, days=7):
-    """Get tasks with deadlines in the next X days."""
-    now = datetime.utcnow()
-    future = now + timedelta(days=days)
-    return [task for task in tasks if now <= task.deadline <= future]
+def get_upcoming_deadlines(session, days=7, user_id=None):
+    """Get open tasks with deadlines in the next X days, soonest first."""
+    now = datetime.now()
+    return get_upcoming_tasks(session, now, now + timedelta(days=days), user_id)
+
+def build_deadline_digests(tasks):
+    """Group deadline-ordered tasks by assigned user."""
+    digests = {}
+    for task in tasks:
+        if task.user is None:
+            continue
+        digests.setdefault(task.user.id, (task.user, []))[1].append(task)
+    return list(digests.values())
+
+def send_deadline_digests(session, days=1):
+    """Send each user a digest of their tasks due in the next X days."""
+    now = datetime.now()
+    tasks = get_upcoming_deadlines(session, days)
+    sent = 0
+    for user, user_tasks in build_deadline_digests(tasks):
+        subject = f"Upcoming Deadlines: {len(user_tasks)} task(s) due soon"
+        lines = "\n".join(
+            f"    - {task.title} (due {task.deadline.strftime('%Y-%m-%d %H:%M')}, "
+            f"in {format_timedelta(task.deadline - now)}, status: {task.status.value})"
+            for task in user_tasks
+        )
+        body = f"""
+    Dear {user.username},
+
+    The following tasks are due in the next {days} day(s):
+
+{lines}
+
+    Please log in to the Intern Task Timeline Tracker to update their status.
+
+    Best regards,
+    Intern Task Timeline Tracker
+    """
+        if send_email_notification(user.email, subject, body):
+            sent += 1
+    return sent
 
 def calculate_completion_rate(tasks):
     """Calculate task completion rate."""
@@ -200,4 +238,7 @@ def get_task_status_color(status):
 
 # Add this at the end of the file
 if __name__ == "__main__":
-    test_email_configuration()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "digest":
+        send_deadline_digests(init_db())
+    else:
+        test_email_configuration()
\ No newline at end of file